@@ -7,12 +7,31 @@ Useful when migrating to a new server setup while keeping Overseer on the old se
 """
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
 import sys
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from heapq import nlargest
+from itertools import chain
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 
+try:
+    import orjson  # Optional: faster JSON decoding for large request lists
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache  # Optional: on-disk cache for CACHE_RESPONSES
+except ImportError:
+    requests_cache = None
+
 # Configuration - Update these values for your setup
 OVERSEER_URL = "https://your-overseer-instance.com"
 API_TOKEN = "your-api-token-here"
@@ -26,6 +45,18 @@ SKIP_CONFIRMATION = False
 # Request throttling - delay in seconds between requests (helps avoid API overload)
 REQUEST_DELAY = 1.0
 
+# Retry attempts for rate-limited (429) or failed (5xx) API calls, with exponential backoff
+MAX_RETRIES = 5
+
+# Maximum number of re-requests in flight at once (still limited to one new request per REQUEST_DELAY)
+REQUEST_CONCURRENCY = 4
+
+# Number of requests fetched per API page (larger pages mean fewer round trips)
+PAGE_SIZE = 100
+
+# Number of request pages to fetch in parallel when loading requests
+FETCH_CONCURRENCY = 8
+
 # For testing - limit number of requests (set to None for no limit)
 TEST_LIMIT = None
 
@@ -48,15 +79,141 @@ INCLUDE_INVALID_DATES = True
 # Set to True to show detailed request structure for debugging
 DEBUG_SHOW_REQUEST_STRUCTURE = False
 
+# Cache fetched request lists on disk between runs, handy while tuning filters
+# (requires the optional requests-cache package; re-requests are never cached)
+CACHE_RESPONSES = False
+CACHE_EXPIRE_AFTER = 300  # Seconds
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API, accepting a trailing 'Z'"""
+    if not isinstance(value, str):
+        raise TypeError(f"expected an ISO 8601 string, got {type(value).__name__}")
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def _filter_date_bounds() -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Parse FILTER_BEFORE_DATE and FILTER_AFTER_DATE into inclusive datetime bounds"""
+    filter_before = None
+    filter_after = None
+    if FILTER_BEFORE_DATE:
+        filter_before = datetime.fromisoformat(f"{FILTER_BEFORE_DATE}T23:59:59+00:00")
+    if FILTER_AFTER_DATE:
+        filter_after = datetime.fromisoformat(f"{FILTER_AFTER_DATE}T00:00:00+00:00")
+    return filter_before, filter_after
+
+# Shared default for missing nested objects (e.g. req.get('media') or _EMPTY),
+# saving an empty dict allocation per lookup. Never mutate it.
+_EMPTY: Dict[str, Any] = {}
+
+# Per-page and per-item progress goes through this logger, so lines written by
+# worker threads are never interleaved
+log = logging.getLogger('overseer_rerequest')
+
+def _setup_logging() -> None:
+    """Send progress messages to stdout without any log prefixes"""
+    if log.handlers:
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _format_json(data: Any) -> str:
+    """Pretty-print data as JSON, using orjson when it is installed"""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=options, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
+class RateLimiter:
+    """Allow at most one call per interval, shared across threads"""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def wait(self) -> None:
+        """Block until the next call is allowed"""
+        # Reserve a start slot under the lock, but sleep outside it so the
+        # time spent waiting overlaps with requests already in flight
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
 class OverseerAPI:
     def __init__(self, url: str, token: str):
         self.base_url = url.rstrip('/')
         self.token = token
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-API-Key': token,
-            'Content-Type': 'application/json'
-        })
+        self.session = self._create_session()
+        # Re-requests get their own session so they can use a stricter retry policy
+        self.post_session = requests.Session()
+        
+        # Retry transient failures (honouring Retry-After on 429), but not connection
+        # errors, so a wrong URL or a server that is down is reported straight away
+        get_retry = Retry(
+            total=MAX_RETRIES,
+            connect=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            raise_on_status=False
+        )
+        # A POST is only retried when the server refused it outright. After a read
+        # error or a 500/502/504, Overseer may already have created the request,
+        # and a retry would be rejected as a duplicate and counted as a failure.
+        post_retry = Retry(
+            total=MAX_RETRIES,
+            connect=0,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 503],
+            allowed_methods=['POST'],
+            raise_on_status=False
+        )
+        
+        # The pool never shrinks below requests' default, but grows if the concurrency
+        # settings are raised past it so every worker thread keeps its connection alive
+        pool_size = max(DEFAULT_POOLSIZE, FETCH_CONCURRENCY, REQUEST_CONCURRENCY)
+        for session, retry in ((self.session, get_retry), (self.post_session, post_retry)):
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'X-API-Key': token,
+                'Content-Type': 'application/json'
+            })
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the HTTP session, caching GET responses on disk if enabled"""
+        if CACHE_RESPONSES:
+            if requests_cache is None:
+                print("⚠️  CACHE_RESPONSES is enabled but requests-cache is not installed - caching disabled")
+            else:
+                return requests_cache.CachedSession(
+                    '.overseer_cache',
+                    backend='sqlite',
+                    expire_after=CACHE_EXPIRE_AFTER,
+                    allowable_methods=['GET'],
+                    # Always check the connection against the live server
+                    urls_expire_after={'*/api/v1/status': requests_cache.DO_NOT_CACHE}
+                )
+        return requests.Session()
     
     def test_connection(self) -> bool:
         """Test if we can connect to the Overseer API"""
@@ -74,37 +231,101 @@ class OverseerAPI:
             print(f"❌ Connection error: {e}")
             return False
     
-    def get_all_requests(self) -> List[Dict[str, Any]]:
-        """Retrieve all requests from Overseer"""
+    def _fetch_requests_page(self, skip: int, take: int, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch a single page of requests, returning None on error"""
+        page = skip // take + 1
+        try:
+            response = self.session.get(
+                f"{self.base_url}/api/v1/request",
+                params={'take': take, 'skip': skip, **params}
+            )
+            
+            if response.status_code != 200:
+                log.error(f"❌ Error fetching requests page {page}: HTTP {response.status_code}")
+                return None
+            
+            return _decode_json(response)
+            
+        except Exception as e:
+            log.error(f"❌ Error fetching requests page {page}: {e}")
+            return None
+    
+    @staticmethod
+    def _page_older_than(data: Dict[str, Any], created_after: datetime) -> bool:
+        """Check whether the last (oldest) request on a page predates created_after"""
+        requests_data = data.get('results', [])
+        if not requests_data:
+            return True
+        
+        try:
+            return _parse_iso_datetime(requests_data[-1].get('createdAt', '')) < created_after
+        except (ValueError, TypeError):
+            return False
+    
+    def get_all_requests(self, requested_by: Optional[int] = None,
+                         created_after: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Retrieve all requests from Overseer, newest first
+        
+        requested_by restricts the results to one user ID on the server side.
+        When created_after is set, pages are fetched in batches of FETCH_CONCURRENCY
+        and no further batches are fetched once a page's oldest request predates it.
+        """
         all_requests = []
-        page = 1
+        params = {'sort': 'added'}
+        if requested_by is not None:
+            params['requestedBy'] = requested_by
+        
+        def fetch(skip: int) -> Optional[Dict[str, Any]]:
+            return self._fetch_requests_page(skip, PAGE_SIZE, params)
         
         print("🔍 Fetching requests...")
         
-        while True:
-            try:
-                response = self.session.get(
-                    f"{self.base_url}/api/v1/request",
-                    params={'take': 50, 'skip': (page - 1) * 50}
-                )
-                
-                if response.status_code != 200:
-                    print(f"❌ Error fetching requests page {page}: HTTP {response.status_code}")
-                    break
-                
-                data = response.json()
-                requests_data = data.get('results', [])
-                
-                if not requests_data:
-                    break
-                
-                all_requests.extend(requests_data)
-                print(f"   Page {page}: Found {len(requests_data)} requests")
-                page += 1
+        # The first page tells us how many requests exist in total
+        first_page = fetch(0)
+        pages = [first_page]
+        skipped_older = False
+        
+        if first_page is not None:
+            total_results = (first_page.get('pageInfo') or _EMPTY).get('results')
+            
+            if total_results is None:
+                # Without a total to plan from, page sequentially until an empty page
+                skip = PAGE_SIZE
+                while pages[-1] is not None and pages[-1].get('results'):
+                    if created_after and self._page_older_than(pages[-1], created_after):
+                        skipped_older = True
+                        break
+                    pages.append(fetch(skip))
+                    skip += PAGE_SIZE
+            else:
+                offsets = list(range(PAGE_SIZE, total_results, PAGE_SIZE))
                 
-            except Exception as e:
-                print(f"❌ Error fetching requests: {e}")
+                # Fetch the remaining pages in parallel. With a date cutoff, go one
+                # batch at a time so we can stop once pages are older than the cutoff.
+                batch_size = FETCH_CONCURRENCY if created_after else max(len(offsets), 1)
+                with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+                    for start in range(0, len(offsets), batch_size):
+                        if None in pages:
+                            break
+                        if created_after and self._page_older_than(pages[-1], created_after):
+                            skipped_older = True
+                            break
+                        pages.extend(executor.map(fetch, offsets[start:start + batch_size]))
+        
+        for page, data in enumerate(pages, 1):
+            # Stop at the first failed page, as the sequential fetch used to
+            if data is None:
                 break
+            
+            requests_data = data.get('results', [])
+            if not requests_data:
+                break
+            
+            all_requests.extend(requests_data)
+            log.info(f"   Page {page}: Found {len(requests_data)} requests")
+        
+        if skipped_older:
+            print(f"   ⏭️  Skipped older pages: remaining requests predate {created_after.date()}")
         
         print(f"📊 Total requests found: {len(all_requests)}")
         return all_requests
@@ -121,16 +342,11 @@ class OverseerAPI:
         # Show structure of first request
         sample_req = requests_list[0]
         print("📋 Sample request structure:")
-        print(json.dumps(sample_req, indent=2, default=str))
+        print(_format_json(sample_req))
         
         # Analyze available fields across all requests
-        all_fields = set()
-        user_fields = set()
-        
-        for req in requests_list:
-            all_fields.update(req.keys())
-            if 'requestedBy' in req and req['requestedBy']:
-                user_fields.update(req['requestedBy'].keys())
+        all_fields = set(chain.from_iterable(requests_list))
+        user_fields = set(chain.from_iterable(req['requestedBy'] for req in requests_list if req.get('requestedBy')))
         
         print(f"\n📊 Available fields in requests: {sorted(all_fields)}")
         if user_fields:
@@ -140,6 +356,10 @@ class OverseerAPI:
     
     def filter_requests(self, requests_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter requests based on configured criteria"""
+        # With no filters configured, skip the per-request checks entirely
+        if not any([FILTER_BEFORE_DATE, FILTER_AFTER_DATE, FILTER_MEDIA_TYPE, FILTER_BY_USER]):
+            return list(requests_list)
+        
         filtered_requests = []
         debug_stats = {
             'total': len(requests_list),
@@ -150,69 +370,73 @@ class OverseerAPI:
             'included': 0
         }
         
+        # Normalize the configured filters once rather than per request
+        filter_before, filter_after = _filter_date_bounds()
+        filter_media_type = FILTER_MEDIA_TYPE.lower() if FILTER_MEDIA_TYPE else None
+        filter_users = None
+        if FILTER_BY_USER:
+            # Accepted spellings of the user: exact (IDs) and lowercased (email/name)
+            filter_users = frozenset({str(FILTER_BY_USER), str(FILTER_BY_USER).lower()})
+        
         for req in requests_list:
             skip_request = False
             
             # Check date filters
-            if FILTER_BEFORE_DATE or FILTER_AFTER_DATE:
+            if filter_before or filter_after:
                 created_at_str = req.get('createdAt', '')
                 request_date = None
                 
                 if created_at_str:
                     try:
                         # Parse the ISO datetime string
-                        request_date = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
+                        request_date = _parse_iso_datetime(created_at_str)
                     except (ValueError, TypeError) as e:
                         debug_stats['date_invalid'] += 1
                         if not INCLUDE_INVALID_DATES:
-                            print(f"⚠️  Skipping request {req.get('id', 'unknown')} - invalid date: {e}")
+                            log.warning(f"⚠️  Skipping request {req.get('id', 'unknown')} - invalid date: {e}")
                             skip_request = True
                         else:
-                            print(f"⚠️  Including request {req.get('id', 'unknown')} despite invalid date: {e}")
+                            log.warning(f"⚠️  Including request {req.get('id', 'unknown')} despite invalid date: {e}")
                 else:
                     debug_stats['date_invalid'] += 1
                     if not INCLUDE_INVALID_DATES:
-                        print(f"⚠️  Skipping request {req.get('id', 'unknown')} - missing date")
+                        log.warning(f"⚠️  Skipping request {req.get('id', 'unknown')} - missing date")
                         skip_request = True
                     else:
-                        print(f"⚠️  Including request {req.get('id', 'unknown')} despite missing date")
+                        log.warning(f"⚠️  Including request {req.get('id', 'unknown')} despite missing date")
                 
                 # Apply date filters if we have a valid date
                 if request_date and not skip_request:
-                    if FILTER_BEFORE_DATE:
-                        filter_before = datetime.fromisoformat(f"{FILTER_BEFORE_DATE}T23:59:59+00:00")
-                        if request_date > filter_before:
-                            debug_stats['date_filtered'] += 1
-                            skip_request = True
+                    if filter_before and request_date > filter_before:
+                        debug_stats['date_filtered'] += 1
+                        skip_request = True
                     
-                    if FILTER_AFTER_DATE and not skip_request:
-                        filter_after = datetime.fromisoformat(f"{FILTER_AFTER_DATE}T00:00:00+00:00")
-                        if request_date < filter_after:
-                            debug_stats['date_filtered'] += 1
-                            skip_request = True
+                    if filter_after and not skip_request and request_date < filter_after:
+                        debug_stats['date_filtered'] += 1
+                        skip_request = True
             
             if skip_request:
                 continue
             
             # Check media type filter
-            if FILTER_MEDIA_TYPE:
+            if filter_media_type:
                 media_type = req.get('type', '')
-                if media_type.lower() != FILTER_MEDIA_TYPE.lower():
+                if media_type.lower() != filter_media_type:
                     debug_stats['media_filtered'] += 1
                     continue
             
             # Check user filter
-            if FILTER_BY_USER:
-                requested_by = req.get('requestedBy', {})
+            if filter_users:
+                requested_by = req.get('requestedBy') or _EMPTY
                 if requested_by:
                     user_id = requested_by.get('id')
-                    user_email = requested_by.get('email', '')
-                    user_name = requested_by.get('displayName', '')
                     
                     # Check if filter matches user ID, email, or display name
-                    if (str(FILTER_BY_USER) != str(user_id) and 
-                        str(FILTER_BY_USER).lower() != user_email.lower() and
-                        str(FILTER_BY_USER).lower() != user_name.lower()):
+                    # (cheap ID checks first, lowercasing only if needed)
+                    if not (user_id == FILTER_BY_USER or
+                            str(user_id) in filter_users or
+                            requested_by.get('email', '').lower() in filter_users or
+                            requested_by.get('displayName', '').lower() in filter_users):
                         debug_stats['user_filtered'] += 1
                         continue
                 else:
@@ -223,24 +447,22 @@ class OverseerAPI:
             filtered_requests.append(req)
         
         # Display filtering summary
-        any_filters_active = any([FILTER_BEFORE_DATE, FILTER_AFTER_DATE, FILTER_MEDIA_TYPE, FILTER_BY_USER])
-        if any_filters_active:
-            print(f"\n🔽 Filtered: {debug_stats['total']} → {debug_stats['included']} requests")
-            if FILTER_BEFORE_DATE:
-                print(f"   📅 Before: {FILTER_BEFORE_DATE}")
-            if FILTER_AFTER_DATE:
-                print(f"   📅 After: {FILTER_AFTER_DATE}")
-            if FILTER_MEDIA_TYPE:
-                print(f"   🎬 Media type: {FILTER_MEDIA_TYPE}")
-            if FILTER_BY_USER:
-                print(f"   👤 User: {FILTER_BY_USER}")
-            
-            print(f"\n📊 Filtering breakdown:")
-            print(f"   🗓️  Date filtered: {debug_stats['date_filtered']}")
-            print(f"   ⚠️  Invalid dates: {debug_stats['date_invalid']} ({'included' if INCLUDE_INVALID_DATES else 'excluded'})")
-            print(f"   🎬 Media filtered: {debug_stats['media_filtered']}")
-            print(f"   👤 User filtered: {debug_stats['user_filtered']}")
-            print(f"   ✅ Included: {debug_stats['included']}")
+        print(f"\n🔽 Filtered: {debug_stats['total']} → {debug_stats['included']} requests")
+        if FILTER_BEFORE_DATE:
+            print(f"   📅 Before: {FILTER_BEFORE_DATE}")
+        if FILTER_AFTER_DATE:
+            print(f"   📅 After: {FILTER_AFTER_DATE}")
+        if FILTER_MEDIA_TYPE:
+            print(f"   🎬 Media type: {FILTER_MEDIA_TYPE}")
+        if FILTER_BY_USER:
+            print(f"   👤 User: {FILTER_BY_USER}")
+        
+        print(f"\n📊 Filtering breakdown:")
+        print(f"   🗓️  Date filtered: {debug_stats['date_filtered']}")
+        print(f"   ⚠️  Invalid dates: {debug_stats['date_invalid']} ({'included' if INCLUDE_INVALID_DATES else 'excluded'})")
+        print(f"   🎬 Media filtered: {debug_stats['media_filtered']}")
+        print(f"   👤 User filtered: {debug_stats['user_filtered']}")
+        print(f"   ✅ Included: {debug_stats['included']}")
         
         return filtered_requests
     
@@ -251,33 +473,26 @@ class OverseerAPI:
             return
         
         # Count by status
-        status_counts = {}
-        media_type_counts = {}
-        user_counts = {}
-        date_counts = {}
+        status_counts = Counter()
+        media_type_counts = Counter()
+        user_counts = Counter()
+        date_counts = Counter()
         
         for req in requests_list:
-            status = req.get('status', 'unknown')
-            media_type = req.get('type', 'unknown')
-            
-            status_counts[status] = status_counts.get(status, 0) + 1
-            media_type_counts[media_type] = media_type_counts.get(media_type, 0) + 1
+            status_counts[req.get('status', 'unknown')] += 1
+            media_type_counts[req.get('type', 'unknown')] += 1
             
-            # Analyze users
-            requested_by = req.get('requestedBy', {})
+            # Analyze users (formatted for display only when printing)
+            requested_by = req.get('requestedBy') or _EMPTY
             if requested_by:
-                user_display = requested_by.get('displayName', 'Unknown User')
-                user_id = requested_by.get('id', 'unknown')
-                user_key = f"{user_display} (ID: {user_id})"
-                user_counts[user_key] = user_counts.get(user_key, 0) + 1
+                user_counts[(requested_by.get('displayName', 'Unknown User'), requested_by.get('id', 'unknown'))] += 1
             
             # Analyze dates (by month)
             created_at_str = req.get('createdAt', '')
             if created_at_str:
                 try:
-                    created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                    month_key = created_at.strftime('%Y-%m')
-                    date_counts[month_key] = date_counts.get(month_key, 0) + 1
+                    created_at = _parse_iso_datetime(created_at_str)
+                    date_counts[(created_at.year, created_at.month)] += 1
                 except (ValueError, TypeError):
                     pass
         
@@ -291,26 +506,25 @@ class OverseerAPI:
             print(f"     {media_type}: {count}")
         
         print("\n   👤 Top requesting users:")
-        sorted_users = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)
-        for user, count in sorted_users[:10]:  # Show top 10 users
-            print(f"     {user}: {count} requests")
+        for (user_display, user_id), count in user_counts.most_common(10):  # Show top 10 users
+            print(f"     {user_display} (ID: {user_id}): {count} requests")
         
         print("\n   📅 Requests by month:")
-        sorted_dates = sorted(date_counts.items())
-        for month, count in sorted_dates[-12:]:  # Show last 12 months
-            print(f"     {month}: {count} requests")
+        recent_months = sorted(nlargest(12, date_counts.items()))  # Show last 12 months
+        for (year, month), count in recent_months:
+            print(f"     {year}-{month:02d}: {count} requests")
         
         # Show sample requests with more details
         print("\n📋 Sample requests:")
         for i, req in enumerate(requests_list[:5]):
-            media_info = req.get('media', {})
+            media_info = req.get('media') or _EMPTY
             title = media_info.get('title', 'Unknown Title')
             status = req.get('status', 'unknown')
             req_type = req.get('type', 'unknown')
             created_at = req.get('createdAt', 'unknown')
             
             # User info
-            requested_by = req.get('requestedBy', {})
+            requested_by = req.get('requestedBy') or _EMPTY
             user_name = "Unknown User"
             if requested_by:
                 user_name = requested_by.get('displayName', 'Unknown User')
@@ -326,7 +540,7 @@ class OverseerAPI:
     def create_request(self, media_id: int, media_type: str, title: str = "Unknown Title") -> bool:
         """Create a new request for the specified media"""
         if DRY_RUN:
-            print(f"   [DRY RUN] Would re-request {media_type} with media ID: {media_id}")
+            log.info(f"   [DRY RUN] Would re-request {media_type} with media ID: {media_id}")
             return True
         
         try:
@@ -335,13 +549,15 @@ class OverseerAPI:
                 'mediaType': media_type
             }
             
-            response = self.session.post(
+            response = self.post_session.post(
                 f"{self.base_url}/api/v1/request",
                 json=payload
             )
             
             if response.status_code in [200, 201]:
-                print(f"   ✅ Successfully re-requested {media_type} (ID: {media_id})")
+                # Include the title: with concurrent workers this line may not directly
+                # follow its own "Processing" line
+                log.info(f"   ✅ Successfully re-requested {media_type} '{title}' (ID: {media_id})")
                 return True
             else:
                 # Try to get more detailed error info
@@ -352,15 +568,18 @@ class OverseerAPI:
                 except:
                     error_detail = response.text[:100] if response.text else "No error details"
                 
-                print(f"   ❌ Failed to re-request {media_type} '{title}' (ID: {media_id})")
-                print(f"      HTTP {response.status_code}: {error_detail}")
+                # Log both lines as one record so concurrent workers can't split them
+                log.error(f"   ❌ Failed to re-request {media_type} '{title}' (ID: {media_id})\n"
+                          f"      HTTP {response.status_code}: {error_detail}")
                 return False
                 
         except Exception as e:
-            print(f"   ❌ Error re-requesting {media_type} '{title}' (ID: {media_id}): {e}")
+            log.error(f"   ❌ Error re-requesting {media_type} '{title}' (ID: {media_id}): {e}")
             return False
 
 def main():
+    _setup_logging()
+    
     print("🎬 Overseer Re-request Script")
     print("=" * 50)
     
@@ -409,8 +628,17 @@ def main():
     
     print()
     
+    # Let the server filter by user ID
+    requested_by = None
+    if isinstance(FILTER_BY_USER, int) and not isinstance(FILTER_BY_USER, bool):
+        requested_by = FILTER_BY_USER
+    
+    # Skip pages older than the after-date, unless requests with missing or invalid
+    # dates should be kept - those can appear on any page, including skipped ones
+    created_after = None if INCLUDE_INVALID_DATES else _filter_date_bounds()[1]
+    
     # Get all requests
-    all_requests = api.get_all_requests()
+    all_requests = api.get_all_requests(requested_by, created_after)
     
     if not all_requests:
         print("No requests found. Exiting.")
@@ -454,31 +682,42 @@ def main():
     # Process re-requests
     print(f"\n🔄 Processing re-requests for {len(requests_to_process)} items...")
     if not DRY_RUN:
-        print(f"⏳ Adding {REQUEST_DELAY}-second delay between requests to avoid API overload...")
+        print(f"⏳ Spacing requests {REQUEST_DELAY} seconds apart (up to {REQUEST_CONCURRENCY} in flight) to avoid API overload...")
     
-    success_count = 0
+    # Extract what each re-request needs up front, skipping items without a media ID
+    total = len(requests_to_process)
+    jobs = []
     failed_count = 0
-    
     for i, req in enumerate(requests_to_process, 1):
-        media_info = req.get('media', {})
+        media_info = req.get('media') or _EMPTY
         media_id = media_info.get('id')
-        media_type = req.get('type', 'movie')  # Default to movie
         title = media_info.get('title', 'Unknown Title')
         
         if media_id:
-            print(f"Processing {i}/{len(requests_to_process)}: {title}")
-            if api.create_request(media_id, media_type, title):
-                success_count += 1
-            else:
-                failed_count += 1
-                
-            # Add delay between requests to avoid overwhelming the API (except in dry run)
-            if not DRY_RUN and i < len(requests_to_process):
-                time.sleep(REQUEST_DELAY)
+            jobs.append((i, media_id, req.get('type', 'movie'), title))  # Default to movie
         else:
-            print(f"⚠️  Skipping {title}: No media ID found")
+            log.warning(f"⚠️  Skipping {title}: No media ID found")
             failed_count += 1
     
+    # Only throttle live requests; dry runs never touch the API
+    limiter = RateLimiter(0 if DRY_RUN else REQUEST_DELAY)
+    
+    def process(job) -> bool:
+        i, media_id, media_type, title = job
+        
+        # Space requests out to avoid overwhelming the API
+        limiter.wait()
+        log.info(f"Processing {i}/{total}: {title}")
+        return api.create_request(media_id, media_type, title)
+    
+    # Dry runs make no API calls, so keep them sequential for readable output
+    workers = 1 if DRY_RUN else REQUEST_CONCURRENCY
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(process, jobs))
+    
+    success_count = results.count(True)
+    failed_count += results.count(False)
+    
     print(f"\n📊 Re-request Summary:")
     print(f"   ✅ Successful: {success_count}")
     print(f"   ❌ Failed: {failed_count}")